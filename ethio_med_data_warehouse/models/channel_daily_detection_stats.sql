@@ -0,0 +1,126 @@
+-- Daily YOLO object-class rollup per channel, maintained incrementally.
+-- Images are saved as `<channel_username>_<message_id>.jpg` by the scraper, so each
+-- detection is joined back to its message and bucketed by the post date.
+-- NOTE: this depends on `telegram_messages.message_id` being populated; detections
+-- whose message is missing are not counted until the message is loaded.
+--
+-- Both source tables are append-only, so a (detection, message) pair is new if either
+-- side is past its watermark: the max detection timestamp and max `telegram_messages.id`
+-- seen by the previous run. Incremental runs aggregate only those pairs and add the
+-- deltas onto the existing rows, so detections loaded before their message are picked
+-- up once the message arrives.
+{{ config(
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key=['channel_username', 'detection_day', 'object_class'],
+    indexes=[{'columns': ['channel_username', 'detection_day', 'object_class'], 'unique': True}]
+) }}
+
+WITH watermarks AS (
+    SELECT
+    {% if is_incremental() %}
+        (SELECT COALESCE(MAX(max_detected_at), '-infinity') FROM {{ this }}) AS old_detected_at,
+        (SELECT COALESCE(MAX(max_message_pk), 0) FROM {{ this }}) AS old_message_pk,
+    {% else %}
+        CAST('-infinity' AS TIMESTAMP) AS old_detected_at,
+        0 AS old_message_pk,
+    {% endif %}
+        (SELECT MAX("timestamp")
+         FROM {{ source('ethio_med_data_warehouse', 'yolo_detections') }}) AS new_detected_at,
+        (SELECT MAX(id)
+         FROM {{ source('ethio_med_data_warehouse', 'telegram_messages') }}) AS new_message_pk
+),
+
+detections AS (
+    SELECT
+        SUBSTRING(image_name FROM '^(.+)_[0-9]+\.[A-Za-z]+$') AS channel_username,
+        CAST(SUBSTRING(image_name FROM '_([0-9]+)\.[A-Za-z]+$') AS BIGINT) AS message_id,
+        object_class,
+        confidence_score,
+        "timestamp" AS detected_at
+    FROM {{ source('ethio_med_data_warehouse', 'yolo_detections') }}
+    WHERE "timestamp" IS NOT NULL
+      AND object_class IS NOT NULL
+      AND image_name ~ '^.+_[0-9]+\.[A-Za-z]+$'
+),
+
+messages AS (
+    SELECT
+        id,
+        channel_username,
+        message_id,
+        CAST(message_date AS DATE) AS post_day
+    FROM {{ source('ethio_med_data_warehouse', 'telegram_messages') }}
+    WHERE message_date IS NOT NULL
+      AND channel_username IS NOT NULL
+      AND message_id IS NOT NULL
+),
+
+new_pairs AS (
+    -- Detections past the watermark, against every message loaded so far
+    SELECT d.channel_username, m.post_day, d.object_class, d.confidence_score
+    FROM detections d
+    CROSS JOIN watermarks w
+    JOIN messages m
+        ON m.channel_username = d.channel_username
+       AND m.message_id = d.message_id
+    WHERE d.detected_at > w.old_detected_at
+      AND d.detected_at <= w.new_detected_at
+      AND m.id <= w.new_message_pk
+
+    UNION ALL
+
+    -- Older detections whose message was loaded after the previous run
+    SELECT d.channel_username, m.post_day, d.object_class, d.confidence_score
+    FROM messages m
+    CROSS JOIN watermarks w
+    JOIN detections d
+        ON d.channel_username = m.channel_username
+       AND d.message_id = m.message_id
+    WHERE m.id > w.old_message_pk
+      AND m.id <= w.new_message_pk
+      AND d.detected_at <= w.old_detected_at
+),
+
+deltas AS (
+    SELECT
+        channel_username,
+        post_day AS detection_day,
+        object_class,
+        COUNT(*) AS detection_count,
+        SUM(confidence_score) AS confidence_score_sum
+    FROM new_pairs
+    GROUP BY channel_username, post_day, object_class
+),
+
+combined AS (
+    SELECT * FROM deltas
+    {% if is_incremental() %}
+    UNION ALL
+    SELECT
+        t.channel_username,
+        t.detection_day,
+        t.object_class,
+        t.detection_count,
+        t.confidence_score_sum
+    FROM {{ this }} t
+    JOIN deltas d
+        ON d.channel_username = t.channel_username
+       AND d.detection_day = t.detection_day
+       AND d.object_class = t.object_class
+    {% endif %}
+)
+
+SELECT
+    c.channel_username,
+    c.detection_day,
+    c.object_class,
+    SUM(c.detection_count) AS detection_count,
+    SUM(c.confidence_score_sum) AS confidence_score_sum,
+    SUM(c.confidence_score_sum) / SUM(c.detection_count) AS avg_confidence_score,
+    -- Every row written by a run carries that run's watermarks
+    MAX(w.new_detected_at) AS max_detected_at,
+    MAX(w.new_message_pk) AS max_message_pk
+FROM combined c
+CROSS JOIN watermarks w
+GROUP BY c.channel_username, c.detection_day, c.object_class
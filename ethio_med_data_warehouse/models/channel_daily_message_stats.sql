@@ -0,0 +1,76 @@
+-- Daily message rollup per channel, maintained incrementally.
+-- `telegram_messages` is append-only with a SERIAL `id`, so incremental runs only
+-- aggregate rows past the watermark (max `id` already folded in) and add those
+-- deltas onto the existing (channel, day) rows.
+{{ config(
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key=['channel_username', 'message_day'],
+    indexes=[{'columns': ['channel_username', 'message_day'], 'unique': True}]
+) }}
+
+WITH raw_data AS (
+    SELECT
+        id,
+        channel_title,
+        channel_username,
+        CAST(message_date AS DATE) AS message_day,
+        NULLIF(emoji_used, 'No emoji') AS emoji_used,
+        NULLIF(youtube_links, 'No YouTube link') AS youtube_links,
+        NULLIF(media_path, 'No Media') AS media_path
+    FROM {{ source('ethio_med_data_warehouse', 'telegram_messages') }}
+    WHERE message_date IS NOT NULL
+      AND channel_username IS NOT NULL
+    {% if is_incremental() %}
+      AND id > (SELECT COALESCE(MAX(max_message_pk), 0) FROM {{ this }})  -- Watermark
+    {% endif %}
+),
+
+deltas AS (
+    SELECT
+        channel_username,
+        MAX(channel_title) AS channel_title,
+        message_day,
+        COUNT(*) AS message_count,
+        COUNT(emoji_used) AS messages_with_emoji,
+        COALESCE(SUM(CHAR_LENGTH(emoji_used)), 0) AS emoji_count,
+        COUNT(youtube_links) AS messages_with_youtube_link,
+        COUNT(media_path) AS messages_with_media,
+        MAX(id) AS max_message_pk
+    FROM raw_data
+    GROUP BY channel_username, message_day
+),
+
+combined AS (
+    SELECT * FROM deltas
+    {% if is_incremental() %}
+    UNION ALL
+    SELECT
+        t.channel_username,
+        t.channel_title,
+        t.message_day,
+        t.message_count,
+        t.messages_with_emoji,
+        t.emoji_count,
+        t.messages_with_youtube_link,
+        t.messages_with_media,
+        t.max_message_pk
+    FROM {{ this }} t
+    JOIN deltas d
+        ON d.channel_username = t.channel_username
+       AND d.message_day = t.message_day
+    {% endif %}
+)
+
+SELECT
+    channel_username,
+    MAX(channel_title) AS channel_title,
+    message_day,
+    SUM(message_count) AS message_count,
+    SUM(messages_with_emoji) AS messages_with_emoji,
+    SUM(emoji_count) AS emoji_count,
+    SUM(messages_with_youtube_link) AS messages_with_youtube_link,
+    SUM(messages_with_media) AS messages_with_media,
+    MAX(max_message_pk) AS max_message_pk
+FROM combined
+GROUP BY channel_username, message_day
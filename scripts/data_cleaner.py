@@ -8,6 +8,14 @@ import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 from logger import get_logger  
 
+# Placeholders written for missing values at the output edge; in memory these are real nulls
+PLACEHOLDERS = {
+    "message": "No Message",
+    "media_path": "No Media",
+    "emoji_used": "No emoji",
+    "youtube_links": "No YouTube link",
+}
+
 class DataCleaner:
     def __init__(self, input_path, output_path):
         self.input_path = input_path
@@ -26,28 +34,36 @@ class DataCleaner:
 
     def extract_emojis(self, text):
         """ Extract emojis from text. """
+        if pd.isna(text):
+            return None
         emojis = ''.join(c for c in text if c in emoji.EMOJI_DATA)
-        return emojis if emojis else "No emoji"
+        return emojis if emojis else None
 
     def remove_emojis(self, text):
         """ Remove emojis from the message text. """
+        if pd.isna(text):
+            return text
         return ''.join(c for c in text if c not in emoji.EMOJI_DATA)
 
     def extract_youtube_links(self, text):
         """ Extract YouTube links from text. """
+        if pd.isna(text):
+            return None
         youtube_pattern = r"(https?://(?:www\.)?(?:youtube\.com|youtu\.be)/[^\s]+)"
         links = re.findall(youtube_pattern, text)
-        return ', '.join(links) if links else "No YouTube link"
+        return ', '.join(links) if links else None
 
     def remove_youtube_links(self, text):
         """ Remove YouTube links from the message text. """
+        if pd.isna(text):
+            return text
         youtube_pattern = r"https?://(?:www\.)?(?:youtube\.com|youtu\.be)/[^\s]+"
         return re.sub(youtube_pattern, '', text).strip()
 
     def clean_text(self, text):
         """ Standardize text by removing newline characters and unnecessary spaces. """
         if pd.isna(text):
-            return "No Message"
+            return None
         return re.sub(r'\n+', ' ', text).strip()
 
     def clean_dataframe(self, df):
@@ -62,13 +78,11 @@ class DataCleaner:
 
             df.loc[:, 'Message ID'] = pd.to_numeric(df['Message ID'], errors="coerce").fillna(0).astype(int)
 
-            df.loc[:, 'Message'] = df['Message'].fillna("No Message")
-            df.loc[:, 'Media Path'] = df['Media Path'].fillna("No Media")
-
-            df.loc[:, 'Channel Title'] = df['Channel Title'].str.strip()
-            df.loc[:, 'Channel Username'] = df['Channel Username'].str.strip()
+            # Channel names repeat on every row; store them as categorical codes
+            df['Channel Title'] = df['Channel Title'].str.strip().astype('category')
+            df['Channel Username'] = df['Channel Username'].str.strip().astype('category')
             df.loc[:, 'Message'] = df['Message'].apply(self.clean_text)
-            df.loc[:, 'Media Path'] = df['Media Path'].str.strip()
+            df['Media Path'] = df['Media Path'].astype(object).str.strip()
 
             df.loc[:, 'emoji_used'] = df['Message'].apply(self.extract_emojis)
             df.loc[:, 'Message'] = df['Message'].apply(self.remove_emojis)
@@ -93,9 +107,14 @@ class DataCleaner:
             self.logger.error(f" Data cleaning error: {e}")
             raise
 
+    def fill_placeholders(self, df):
+        """ Replace missing values with their placeholder strings for output. """
+        return df.fillna({col: value for col, value in PLACEHOLDERS.items() if col in df.columns})
+
     def save_cleaned_data(self, df):
         """ Save cleaned data to a CSV file. """
         try:
+            df = self.fill_placeholders(df)
             df.to_csv(self.output_path, index=False)
             self.logger.info(f" Cleaned data saved to '{self.output_path}'.")
             print(f" Cleaned data saved to '{self.output_path}'.")
@@ -0,0 +1,63 @@
+import os
+import sys
+import pandas as pd
+import pytest
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../scripts')))
+from data_cleaner import DataCleaner
+
+RAW_CSV = (
+    "Channel Title,Channel Username,Message ID,Message,Date,Media Path\n"
+    ' Chem ,@CheMeds,1,"Hi \U0001F600\nthere https://youtu.be/x",2025-02-04 10:00:00+00:00,\n'
+    "Chem,@CheMeds,1,duplicate,2025-02-04,\n"
+    "Chem,@CheMeds,2,,2025-02-05,./data/photos/a.jpg\n"
+    "Doc,@DoctorsET,3,\U0001F600,bad,\n"
+)
+
+@pytest.fixture
+def cleaner(tmp_path):
+    input_path = tmp_path / "scraped_data.csv"
+    input_path.write_text(RAW_CSV, encoding="utf-8")
+    return DataCleaner(input_path=str(input_path), output_path=str(tmp_path / "cleaned_data.csv"))
+
+# Test channel columns are categorical and missing values stay null in memory
+def test_clean_dataframe_is_compact(cleaner):
+    df = cleaner.clean_dataframe(cleaner.load_csv())
+
+    assert len(df) == 3  # Duplicate Message ID dropped
+    assert isinstance(df["channel_title"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["channel_username"].dtype, pd.CategoricalDtype)
+    assert list(df["channel_title"]) == ["Chem", "Chem", "Doc"]
+
+    assert df["message"].isna().tolist() == [False, True, False]
+    assert df["media_path"].isna().tolist() == [True, False, True]
+    assert df["emoji_used"].tolist()[0] == "\U0001F600"
+    assert df["emoji_used"].isna().tolist() == [False, True, False]
+    assert df["youtube_links"].isna().tolist() == [False, True, True]
+    assert df["message"].tolist()[2] == ""  # Emoji-only text is empty, not missing
+
+# Test placeholders are restored when the cleaned data is written out
+def test_save_cleaned_data_fills_placeholders(cleaner):
+    df = cleaner.run()
+    saved = pd.read_csv(cleaner.output_path, keep_default_na=False)
+
+    assert saved["message"].tolist() == ["Hi  there", "No Message", ""]
+    assert saved["media_path"].tolist() == ["No Media", "./data/photos/a.jpg", "No Media"]
+    assert saved["emoji_used"].tolist() == ["\U0001F600", "No emoji", "\U0001F600"]
+    assert saved["youtube_links"].tolist() == [
+        "https://youtu.be/x", "No YouTube link", "No YouTube link"
+    ]
+    # The in-memory frame is left untouched
+    assert df["media_path"].isna().sum() == 2
+
+# Test an all-missing media column is handled
+def test_clean_dataframe_all_missing_media(cleaner, tmp_path):
+    input_path = tmp_path / "no_media.csv"
+    input_path.write_text(
+        "Channel Title,Channel Username,Message ID,Message,Date,Media Path\n"
+        "Doc,@DoctorsET,1,hello,2025-02-04,\n",
+        encoding="utf-8",
+    )
+    cleaner.input_path = str(input_path)
+    cleaner.run()
+    saved = pd.read_csv(cleaner.output_path, keep_default_na=False)
+    assert saved["media_path"].tolist() == ["No Media"]